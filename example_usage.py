@@ -4,6 +4,7 @@ Example usage of the NIH Reporter Search Tool
 """
 
 import json
+from dataclasses import asdict
 from nih_reporter_search import NIHReporterSearcher
 
 def main():
@@ -22,18 +23,21 @@ def main():
     for name in names:
         print(f"Searching for: {name}")
         projects = searcher.search_person(name)
-        yearly_data = searcher.process_funding_data(projects)
+        funding_data = searcher.process_funding_data(projects)
         
         results[name] = {
-            'total_projects': len(projects),
-            'yearly_funding': yearly_data
+            'total_projects': funding_data['project_count'],
+            'total_direct_costs': funding_data['total_direct_costs'],
+            'total_costs': funding_data['total_costs'],
+            'projects': funding_data['projects']
         }
         
         print(f"Found {len(projects)} projects for {name}")
     
     # Print results
     print("\nResults:")
-    print(json.dumps(results, indent=2))
+    # Projects are ProjectRecord dataclasses, so convert them for json
+    print(json.dumps(results, indent=2, default=asdict))
 
 if __name__ == "__main__":
     main()
@@ -6,98 +6,794 @@ This script searches the NIH Reporter API for funding information
 for a list of names provided in a YAML file.
 """
 
-import json
+import asyncio
+import orjson
 import yaml
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import argparse
 import csv
+import functools
+import hashlib
+import importlib.util
+import io
+import operator
 import os
-from datetime import datetime
-from typing import Dict, List, Any
+import random
+import shelve
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment
-from collections import defaultdict
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, NamedStyle
+from openpyxl.utils import get_column_letter
+from collections import OrderedDict, defaultdict
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+# HTTP status codes that indicate a transient failure worth retrying
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Longest wait, in seconds, between retries of a request
+MAX_BACKOFF = 30
+
+# Results per page (the maximum allowed by the API) and the largest offset it accepts
+PAGE_SIZE = 500
+MAX_OFFSET = 14999
+
+# Project fields requested from the API; everything else (abstracts, terms, ...) is left out
+INCLUDE_FIELDS = [
+    "ProjectNum", "ProjectTitle", "ProjectStartDate", "ProjectEndDate",
+    "BudgetStart", "BudgetEnd", "DirectCostAmt", "IndirectCostAmt",
+    "AwardAmount", "PrincipalInvestigators"
+]
+
+# Punctuation ignored when matching searched names to PI names; hyphens separate parts
+NAME_MATCH_TRANSLATION = str.maketrans({'.': None, ',': None, "'": None, '-': ' '})
+
+# Periods removed from names before searching (e.g. middle initials)
+NAME_CLEAN_TRANSLATION = str.maketrans('', '', '.')
+
+# Project fields written as columns of the Parquet results, after the person's name
+PARQUET_FIELDS = (
+    'project_id', 'title', 'start_date', 'end_date',
+    'direct_costs', 'indirect_costs', 'award_amount', 'total_costs'
+)
+
+# Most search results kept in the in-memory cache, least recently used dropped first
+MEMORY_CACHE_SIZE = 4096
+
+# Buffer size for output files, large enough to flush a summary in one system call
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Summary file columns, shared by the CSV and Excel writers
+SUMMARY_HEADERS = ['Name', 'Total_Direct_Costs', 'Total_Costs', 'Most_Recent_Year', 'Total_Projects',
+                   'Current_Direct_Costs', 'Current_Total_Costs', 'Current_Projects']
+
+# Style for Excel summary headers
+HEADER_FONT = Font(bold=True, color="FFFFFF")
+HEADER_FILL = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="center")
+
+# Raw API fields read by process_funding_data, in unpacking order
+PROJECT_FIELDS = operator.itemgetter(
+    'project_num', 'project_title', 'budget_start', 'budget_end',
+    'project_start_date', 'project_end_date',
+    'direct_cost_amt', 'indirect_cost_amt', 'award_amount'
+)
+
+
+@dataclass(slots=True)
+class ProjectRecord:
+    """Funding information for a single processed project."""
+    project_id: str
+    title: str
+    start_date: str          # Budget start date (or project start date if budget not available)
+    end_date: str            # Budget end date (or project end date if budget not available)
+    direct_costs: float
+    indirect_costs: float
+    award_amount: float
+    total_costs: float
+
+
+@dataclass(slots=True)
+class DetailedProjectRecord(ProjectRecord):
+    """Processed project that also keeps the raw budget and project dates."""
+    budget_start_date: str
+    budget_end_date: str
+    project_start_date: str
+    project_end_date: str
+
+
+@dataclass(slots=True)
+class SummaryRow:
+    """Summary figures for one person, as written to the CSV and Excel files."""
+    name: str                        # "Last Name, First Name"
+    total_direct_costs: float
+    total_costs: float
+    most_recent_year: Optional[int]
+    total_projects: int
+    current_direct_costs: float
+    current_total_costs: float
+    current_projects: int
+
+
+@functools.lru_cache(maxsize=4096)
+def _last_name_key(name: str) -> str:
+    """
+    Build the sort key for a full name: its last name, case-folded.
+    
+    Args:
+        name: Full name in "First Name Last Name" format
+        
+    Returns:
+        The case-folded last name, or an empty string for a blank name
+    """
+    # Split off the last whitespace-separated part as the last name
+    parts = name.rsplit(None, 1)
+    if not parts:
+        return ""
+    return parts[-1].casefold()
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_name_last_first(name: str) -> str:
+    """
+    Format name as "Last Name, First Name".
+    
+    Args:
+        name: Full name in "First Name Last Name" format
+        
+    Returns:
+        Name formatted as "Last Name, First Name"
+    """
+    parts = name.strip().split()
+    if len(parts) < 2:
+        return name  # Return as-is if can't split properly
+    
+    # Last name is the last part, everything else is first name
+    last_name = parts[-1]
+    first_name = ' '.join(parts[:-1])
+    
+    return f"{last_name}, {first_name}"
 
 
 class NIHReporterSearcher:
     """Class to handle NIH Reporter API searches."""
     
-    def __init__(self):
+    def __init__(self, max_connections: int = 16, max_concurrency: int = 8,
+                 max_retries: int = 5, timeout: float = 30.0,
+                 cache_dir: str = None, cache_ttl: float = 24 * 60 * 60,
+                 include_raw_dates: bool = False):
         self.base_url = "https://api.reporter.nih.gov/v2/projects/search"
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             'Content-Type': 'application/json',
-            'User-Agent': 'NIH-Reporter-Search-Tool/1.0'
-        })
+            'User-Agent': 'NIH-Reporter-Search-Tool/1.0',
+            'Accept-Encoding': 'gzip, deflate',  # Both HTTP clients decompress transparently
+            'Connection': 'keep-alive'
+        }
+        self.max_connections = max_connections  # Connection limit for concurrent searches
+        self.max_concurrency = max_concurrency  # Searches allowed in flight at once
+        self.max_retries = max_retries          # Attempts per search on transient errors
+        self.timeout = timeout                  # Per-request timeout in seconds
+        self.cache_dir = cache_dir              # Directory for the on-disk result cache (optional)
+        self.cache_ttl = cache_ttl              # Seconds before a cached result expires
+        self.include_raw_dates = include_raw_dates  # Keep raw budget/project dates on each project
+        self._memory_cache = OrderedDict()       # Cache key -> (fetched_at, projects), in LRU order
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        
+        # Reuse pooled connections to the API host and retry transient failures
+        adapter = HTTPAdapter(
+            pool_connections=max_connections,
+            pool_maxsize=max_connections,
+            max_retries=Retry(
+                total=max_retries,
+                backoff_factor=0.5,
+                status_forcelist=RETRY_STATUS_CODES,
+                allowed_methods=["POST"]
+            )
+        )
+        self.session.mount("https://", adapter)
     
-    def search_person(self, name: str, organization: str = None) -> List[Dict[str, Any]]:
+    def close(self) -> None:
+        """Close the pooled connections held by the synchronous session."""
+        self.session.close()
+    
+    def __enter__(self) -> 'NIHReporterSearcher':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def _build_search_criteria(self, names: List[str], organization: str = None,
+                               offset: int = 0) -> Dict[str, Any]:
         """
-        Search for funding information for a specific person.
+        Build the API request body for one page of a search.
         
         Args:
-            name: The name of the person to search for
+            names: Names of the people to search for
             organization: Optional organization to filter by
+            offset: Index of the first result to return
             
         Returns:
-            List of project dictionaries from the API
+            Search criteria dictionary to POST to the API
         """
-        # Prepare the search criteria
         criteria = {
-            "pi_names": [{"any_name": name}]
+            "pi_names": [{"any_name": name} for name in names]
         }
         
         # Add organization filter if provided
         if organization:
             criteria["org_names"] = [organization]
         
-        search_criteria = {
+        return {
             "criteria": criteria,
-            "offset": 0,
-            "limit": 500,  # Maximum allowed by API
+            "include_fields": INCLUDE_FIELDS,
+            "offset": offset,
+            "limit": PAGE_SIZE,
             "sort_field": "project_start_date",
             "sort_order": "desc"
         }
+    
+    def _page_offsets(self, total: int) -> range:
+        """
+        Offsets of the pages remaining after the first one.
         
-        try:
-            response = self.session.post(self.base_url, json=search_criteria)
+        Args:
+            total: Total number of matching projects reported by the API
+            
+        Returns:
+            Range of offsets for the remaining pages
+        """
+        # The API refuses offsets beyond MAX_OFFSET
+        return range(PAGE_SIZE, min(total, MAX_OFFSET + 1), PAGE_SIZE)
+    
+    def iter_projects(self, names: List[str], organization: str = None) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily fetch every page of projects matching any of the given names.
+        
+        Pages are requested one at a time as the iterator is consumed, so only
+        one page is held in memory. Request errors are raised while iterating.
+        
+        Args:
+            names: Names of the people to search for
+            organization: Optional organization to filter by
+            
+        Yields:
+            Project dictionaries from the API
+        """
+        offset = 0
+        while True:
+            response = self.session.post(self.base_url,
+                                         data=orjson.dumps(self._build_search_criteria(names, organization, offset)),
+                                         timeout=self.timeout)
             response.raise_for_status()
+            data = orjson.loads(response.content)
+            page = data.get('results', [])
+            yield from page
+            
+            offset += PAGE_SIZE
+            total = data.get('meta', {}).get('total', 0)
+            if len(page) < PAGE_SIZE or offset >= min(total, MAX_OFFSET + 1):
+                break
+    
+    def _fetch_projects(self, names: List[str], organization: str = None) -> List[Dict[str, Any]]:
+        """
+        Fetch every page of projects matching any of the given names.
+        
+        Args:
+            names: Names of the people to search for
+            organization: Optional organization to filter by
+            
+        Returns:
+            List of project dictionaries from the API
+        """
+        return list(self.iter_projects(names, organization))
+    
+    def _name_parts(self, name: str) -> List[str]:
+        """
+        Split a name into lowercase parts for matching, ignoring punctuation.
+        
+        Args:
+            name: Name to split
             
-            data = response.json()
-            return data.get('results', [])
+        Returns:
+            List of name parts
+        """
+        return name.lower().translate(NAME_MATCH_TRANSLATION).split()
+    
+    def _group_projects_by_name(self, names: List[str],
+                                projects: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Assign projects from a batched search back to the people searched for.
+        
+        A project is assigned to a name when one of its principal investigators
+        shares that name's last name and has a first name starting with the
+        name's first part, ignoring case and punctuation. Middle names and
+        initials are not matched against the PI's first name, except when the
+        first part is a bare initial (as in "C. Sophia Albott"), when the
+        second part may match instead. A project with several matching PIs is
+        assigned to each.
+        
+        Args:
+            names: Names that were searched for together
+            projects: List of project dictionaries from the API
+            
+        Returns:
+            Dictionary mapping each name to its list of projects
+        """
+        grouped = {name: [] for name in names}
+        
+        # With a single name every result belongs to it, as for search_person
+        if len(grouped) == 1:
+            grouped[names[0]] = list(projects)
+            return grouped
+        
+        # Index the names by last name so each PI is only checked against
+        # the names that could match it
+        names_by_last_name = defaultdict(list)
+        for name in grouped:
+            parts = self._name_parts(name)
+            if parts:
+                names_by_last_name[parts[-1]].append((name, parts[:-1]))
+        
+        for project in projects:
+            matched = set()
+            for pi in project.get('principal_investigators') or []:
+                first_name = None
+                for last_part in self._name_parts(pi.get('last_name') or ''):
+                    for name, first_parts in names_by_last_name.get(last_part, ()):
+                        if name in matched:
+                            continue
+                        if first_name is None:
+                            first_name = ''.join(self._name_parts(pi.get('first_name') or ''))
+                        if self._first_name_matches(first_parts, first_name):
+                            matched.add(name)
+                            grouped[name].append(project)
+        
+        return grouped
+    
+    def _first_name_matches(self, given_parts: List[str], first_name: str) -> bool:
+        """
+        Check a PI's first name against the given names of a searched name.
+        
+        Args:
+            given_parts: Lowercase parts of the searched name before its last name
+            first_name: The PI's lowercase first name, without spaces or punctuation
+            
+        Returns:
+            True if the PI's first name is consistent with the searched name
+        """
+        if not given_parts:
+            return True
+        if first_name.startswith(given_parts[0]):
+            return True
+        # A leading initial may stand for a first name the PI does not go by
+        return len(given_parts[0]) == 1 and len(given_parts) > 1 and first_name.startswith(given_parts[1])
+    
+    def _names_to_search_individually(self, projects: List[Dict[str, Any]],
+                                      grouped: Dict[str, List[Dict[str, Any]]]) -> List[str]:
+        """
+        Find names from a batched search whose projects may have been missed.
+        
+        If some returned projects could not be assigned to anyone, the API
+        matched a PI spelled differently from the names given. Every name
+        sharing a last name with a PI on those projects, and every name left
+        without projects, is then worth searching for on its own, so a partial
+        batch match is never taken (and cached) as the complete result.
+        
+        Args:
+            projects: List of project dictionaries returned for the batch
+            grouped: Projects assigned to each name by _group_projects_by_name
+            
+        Returns:
+            Names to search for individually
+        """
+        if len(grouped) < 2:
+            return []
+        
+        assigned = {id(project) for name_projects in grouped.values() for project in name_projects}
+        unassigned = [project for project in projects if id(project) not in assigned]
+        if not unassigned:
+            return []
+        
+        unassigned_last_names = {
+            last_part
+            for project in unassigned
+            for pi in project.get('principal_investigators') or []
+            for last_part in self._name_parts(pi.get('last_name') or '')
+        }
+        
+        names = []
+        for name, name_projects in grouped.items():
+            parts = self._name_parts(name)
+            if not name_projects or (parts and parts[-1] in unassigned_last_names):
+                names.append(name)
+        return names
+    
+    def _cache_key(self, name: str, organization: str = None) -> str:
+        """
+        Build the cache key for a search.
+        
+        The key covers the API endpoint and requested fields as well as the
+        search itself, so changing either never returns stale results.
+        
+        Args:
+            name: The name of the person searched for
+            organization: Optional organization filter used
+            
+        Returns:
+            Hex digest identifying the search
+        """
+        key = f"{self.base_url}|{','.join(INCLUDE_FIELDS)}|{name}|{organization or ''}"
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()
+    
+    def _load_cached(self, names: List[str], organization: str = None,
+                     keep_in_memory: bool = True) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Look up previous search results, in memory first and then on disk.
+        
+        Args:
+            names: Names of the people to look up
+            organization: Optional organization filter used
+            keep_in_memory: Whether results found on disk are also kept in memory
+            
+        Returns:
+            Dictionary mapping each name with an unexpired cached result to its projects
+        """
+        cached = {}
+        missing = []
+        now = time.time()
+        for name in names:
+            key = self._cache_key(name, organization)
+            entry = self._memory_cache.get(key)
+            if entry is not None and now - entry[0] < self.cache_ttl:
+                self._memory_cache.move_to_end(key)
+                cached[name] = entry[1]
+            else:
+                missing.append(name)
+        
+        # Searches are POSTs, which the API does not answer with ETag or
+        # Last-Modified validators, so entries cannot be revalidated with a
+        # conditional request; they are trusted until cache_ttl has passed
+        if missing and self.cache_dir and os.path.isdir(self.cache_dir):
+            with shelve.open(os.path.join(self.cache_dir, 'search_cache')) as shelf:
+                for name in missing:
+                    key = self._cache_key(name, organization)
+                    entry = shelf.get(key)
+                    if entry is not None and now - entry[0] < self.cache_ttl:
+                        cached[name] = entry[1]
+                        if keep_in_memory:
+                            self._remember(key, entry)
+        
+        return cached
+    
+    def _remember(self, key: str, entry: Tuple[float, List[Dict[str, Any]]]) -> None:
+        """
+        Add an entry to the in-memory cache, dropping the least recently used.
+        
+        Args:
+            key: Cache key of the search
+            entry: Tuple of the fetch time and the projects found
+        """
+        self._memory_cache[key] = entry
+        self._memory_cache.move_to_end(key)
+        while len(self._memory_cache) > MEMORY_CACHE_SIZE:
+            self._memory_cache.popitem(last=False)
+    
+    def _store_cached(self, results: Dict[str, List[Dict[str, Any]]], organization: str = None,
+                      keep_in_memory: bool = True) -> None:
+        """
+        Remember search results in memory and, if configured, on disk.
+        
+        Args:
+            results: Dictionary mapping each name to its projects
+            organization: Optional organization filter used
+            keep_in_memory: Whether results are also kept in memory
+        """
+        now = time.time()
+        if keep_in_memory:
+            for name, projects in results.items():
+                self._remember(self._cache_key(name, organization), (now, projects))
+        
+        if results and self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with shelve.open(os.path.join(self.cache_dir, 'search_cache')) as shelf:
+                for name, projects in results.items():
+                    shelf[self._cache_key(name, organization)] = (now, projects)
+    
+    def search_person(self, name: str, organization: str = None) -> List[Dict[str, Any]]:
+        """
+        Search for funding information for a specific person.
+        
+        Args:
+            name: The name of the person to search for
+            organization: Optional organization to filter by
+            
+        Returns:
+            List of project dictionaries from the API
+        """
+        cached = self._load_cached([name], organization)
+        if name in cached:
+            return cached[name]
+        
+        try:
+            projects = self._fetch_projects([name], organization)
+            self._store_cached({name: projects}, organization)
+            return projects
             
         except requests.exceptions.RequestException as e:
             print(f"Error searching for {name}: {e}")
             return []
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             print(f"Error parsing response for {name}: {e}")
             return []
     
-    def process_funding_data(self, projects: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def search_people_batch(self, names: List[str], organization: str = None,
+                            batch_size: int = 25) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Search for several people using one API search per batch of names.
+        
+        Cached results are reused; the remaining names are searched
+        concurrently in batches, as search_names_from_yaml does.
+        
+        Args:
+            names: Names of the people to search for
+            organization: Optional organization to filter by
+            batch_size: Number of names to combine into each search
+            
+        Returns:
+            Dictionary mapping each name to its list of projects (empty if
+            its search failed)
+        """
+        results = self._load_cached(names, organization)
+        pending = [name for name in dict.fromkeys(names) if name not in results]
+        if not pending:
+            return results
+        
+        fetched = asyncio.run(self._search_names_async(pending, organization, batch_size))
+        found = {}
+        for name, projects in fetched.items():
+            if isinstance(projects, Exception):
+                print(f"Error searching for {name}: {projects}")
+                results[name] = []
+            else:
+                found[name] = results[name] = projects
+        self._store_cached(found, organization)
+        
+        return {name: results[name] for name in names}
+    
+    async def _post_async(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                          search_criteria: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        POST one search request without blocking.
+        
+        Rate limiting (429), server errors (5xx), dropped connections and
+        timeouts are retried with exponential backoff, waiting as long as the
+        server's Retry-After header asks when it sends one. Other errors are
+        raised to the caller.
+        
+        Args:
+            session: Shared aiohttp session to issue the request on
+            semaphore: Semaphore bounding the number of requests in flight
+            search_criteria: Request body to POST to the API
+            
+        Returns:
+            Decoded API response
+        """
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        request_body = orjson.dumps(search_criteria)
+        
+        # Always make at least one attempt, whatever max_retries is set to
+        attempts = max(1, self.max_retries)
+        for attempt in range(attempts):
+            retry_after = None
+            try:
+                async with semaphore:
+                    async with session.post(self.base_url, data=request_body, timeout=timeout) as response:
+                        response.raise_for_status()
+                        return await response.json(loads=orjson.loads)
+            except aiohttp.ClientResponseError as e:
+                if e.status not in RETRY_STATUS_CODES or attempt == attempts - 1:
+                    raise
+                retry_after = self._retry_after_seconds(e.headers)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == attempts - 1:
+                    raise
+            
+            if retry_after is None:
+                retry_after = min(MAX_BACKOFF, 2 ** attempt) + random.random()
+            
+            # Back off outside the semaphore so other searches can proceed
+            await asyncio.sleep(retry_after)
+        
+        # The last attempt either returns or raises, so this is never reached
+        raise RuntimeError(f"Search request gave no response after {attempts} attempts")
+    
+    def _retry_after_seconds(self, headers) -> Optional[float]:
+        """
+        Read the wait requested by a Retry-After header.
+        
+        Args:
+            headers: Response headers, or None if there were none
+            
+        Returns:
+            Seconds to wait, capped at MAX_BACKOFF, or None if the header is
+            missing or not a number of seconds
+        """
+        value = headers.get('Retry-After') if headers else None
+        if value is None or not value.strip().isdigit():
+            return None
+        return float(min(MAX_BACKOFF, int(value)))
+    
+    async def _search_people_async(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                                   names: List[str], organization: str = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Search for a batch of people without blocking.
+        
+        The first page reports the total number of matches; any remaining
+        pages are then fetched concurrently.
+        
+        Args:
+            session: Shared aiohttp session to issue the request on
+            semaphore: Semaphore bounding the number of requests in flight
+            names: Names of the people to search for
+            organization: Optional organization to filter by
+            
+        Returns:
+            Dictionary mapping each name to its list of projects, or to the
+            exception raised if its individual re-search failed
+        """
+        data = await self._post_async(session, semaphore, self._build_search_criteria(names, organization))
+        projects = data.get('results', [])
+        
+        total = data.get('meta', {}).get('total', 0)
+        pages = await asyncio.gather(*[
+            self._post_async(session, semaphore, self._build_search_criteria(names, organization, offset))
+            for offset in self._page_offsets(total)
+        ])
+        for page in pages:
+            projects.extend(page.get('results', []))
+        
+        grouped = self._group_projects_by_name(names, projects)
+        individual_names = self._names_to_search_individually(projects, grouped)
+        retried = await asyncio.gather(*[
+            self._search_people_async(session, semaphore, [name], organization)
+            for name in individual_names
+        ], return_exceptions=True)
+        for name, name_result in zip(individual_names, retried):
+            # A failed re-search only affects its own name; the rest of the
+            # batch keeps its grouped projects
+            if isinstance(name_result, Exception):
+                grouped[name] = name_result
+            else:
+                grouped.update(name_result)
+        
+        return grouped
+    
+    async def _search_names_async(self, names: List[str], organization: str = None, batch_size: int = 25,
+                                  on_batch: Callable[[Dict[str, Any]], None] = None) -> Dict[str, Any]:
+        """
+        Search for many people concurrently over a single connection pool.
+        
+        Names are combined into batches of batch_size, one search per batch.
+        Each batch is handed to on_batch as soon as it completes, so processing
+        finished batches overlaps with the requests still in flight. Batches
+        handed to on_batch are not also collected, so their raw projects can be
+        released once processed.
+        
+        Args:
+            names: Names to search for
+            organization: Optional organization to filter by
+            batch_size: Number of names to combine into each search
+            on_batch: Optional callback invoked with the results of each
+                completed batch, in the same form as the return value
+            
+        Returns:
+            Dictionary mapping each name to either its project list or the
+            exception raised while searching for its batch; empty when
+            on_batch is given
+        """
+        batches = [names[start:start + batch_size] for start in range(0, len(names), batch_size)]
+        
+        async def search_batch(batch: List[str]):
+            try:
+                return batch, await self._search_people_async(session, semaphore, batch, organization)
+            except Exception as e:
+                return batch, e
+        
+        results = {}
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        connector = aiohttp.TCPConnector(limit=self.max_connections)
+        async with aiohttp.ClientSession(headers=self.headers, connector=connector) as session:
+            for finished in asyncio.as_completed([search_batch(batch) for batch in batches]):
+                batch, batch_result = await finished
+                if isinstance(batch_result, Exception):
+                    batch_result = {name: batch_result for name in batch}
+                
+                if on_batch:
+                    on_batch(batch_result)
+                else:
+                    results.update(batch_result)
+        
+        return results
+    
+    def _parse_date(self, value: str) -> Optional[date]:
+        """
+        Parse an API date string.
+        
+        API dates are ISO-8601, so the date part is handed to the C-level
+        date.fromisoformat rather than parsed field by field.
+        
+        Args:
+            value: Date in "YYYY-MM-DDTHH:MM:SS" or "YYYY-MM-DD" format
+            
+        Returns:
+            The parsed date, or None if the value is not a recognized date
+        """
+        try:
+            return date.fromisoformat(value[:10])
+        except ValueError:
+            return None
+    
+    def process_funding_data(self, projects: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Process funding data and organize projects directly.
         
+        Projects are consumed in a single pass, so any iterable works,
+        including the lazy iter_projects.
+        
         Args:
-            projects: List of project dictionaries from API
+            projects: Iterable of project dictionaries from API
             
         Returns:
-            Dictionary with project data and totals
+            Dictionary with totals and a list of ProjectRecord entries
+            (DetailedProjectRecord when include_raw_dates is set)
         """
         total_direct_costs = 0.0
         total_costs = 0.0
+        current_direct_costs = 0.0
+        current_total_costs = 0.0
+        current_project_count = 0
+        latest_end_date = None
+        today = date.today()
         processed_projects = []
+        append_project = processed_projects.append
         
         for project in projects:
-            # Extract project information
-            project_id = project.get('project_num', 'Unknown')
-            title = project.get('project_title', 'Unknown Title')
+            # Extract project information; every field is normally present (possibly None)
+            try:
+                (project_id, title, budget_start, budget_end, project_start, project_end,
+                 direct_costs, indirect_costs, award_amount) = PROJECT_FIELDS(project)
+            except KeyError:
+                project_id = project.get('project_num', 'Unknown')
+                title = project.get('project_title', 'Unknown Title')
+                budget_start = project.get('budget_start', '')
+                budget_end = project.get('budget_end', '')
+                project_start = project.get('project_start_date', '')
+                project_end = project.get('project_end_date', '')
+                direct_costs = project.get('direct_cost_amt')
+                indirect_costs = project.get('indirect_cost_amt')
+                award_amount = project.get('award_amount')
+            
             # Use budget dates instead of project dates
-            start_date = project.get('budget_start', '') or project.get('project_start_date', '')
-            end_date = project.get('budget_end', '') or project.get('project_end_date', '')
+            start_date = budget_start or project_start
+            end_date = budget_end or project_end
             
-            # Extract funding information (handle None values and different field names)
-            direct_costs = project.get('direct_cost_amt', 0.0) or 0.0
-            indirect_costs = project.get('indirect_cost_amt', 0.0) or 0.0
-            award_amount = project.get('award_amount', 0.0) or 0.0
+            # Extract funding information (handle None values)
+            direct_costs = direct_costs or 0.0
+            indirect_costs = indirect_costs or 0.0
+            award_amount = award_amount or 0.0
             
             # Calculate total costs: if award_amount is available, use it; otherwise sum direct + indirect
             if award_amount > 0:
@@ -109,25 +805,58 @@ class NIHReporterSearcher:
             total_direct_costs += direct_costs
             total_costs += project_total_costs
             
+            # Track the most recent end date that parses; valid ISO dates sort
+            # lexicographically, but stray values like 'n/a' would sort last
+            project_end_day = self._parse_date(end_date) if end_date else None
+            if project_end_day is not None and (latest_end_date is None or end_date > latest_end_date):
+                latest_end_date = end_date
+            
             # Add project to list
-            processed_projects.append({
-                'project_id': project_id,
-                'title': title,
-                'start_date': start_date,  # Budget start date (or project start date if budget not available)
-                'end_date': end_date,      # Budget end date (or project end date if budget not available)
-                'budget_start_date': project.get('budget_start', ''),
-                'budget_end_date': project.get('budget_end', ''),
-                'project_start_date': project.get('project_start_date', ''),
-                'project_end_date': project.get('project_end_date', ''),
-                'direct_costs': direct_costs,
-                'indirect_costs': indirect_costs,
-                'award_amount': award_amount,
-                'total_costs': project_total_costs
-            })
+            if self.include_raw_dates:
+                append_project(DetailedProjectRecord(
+                    project_id=project_id,
+                    title=title,
+                    start_date=start_date,
+                    end_date=end_date,
+                    direct_costs=direct_costs,
+                    indirect_costs=indirect_costs,
+                    award_amount=award_amount,
+                    total_costs=project_total_costs,
+                    budget_start_date=budget_start,
+                    budget_end_date=budget_end,
+                    project_start_date=project_start,
+                    project_end_date=project_end
+                ))
+            else:
+                append_project(ProjectRecord(
+                    project_id=project_id,
+                    title=title,
+                    start_date=start_date,
+                    end_date=end_date,
+                    direct_costs=direct_costs,
+                    indirect_costs=indirect_costs,
+                    award_amount=award_amount,
+                    total_costs=project_total_costs
+                ))
+            
+            # Add to current funding if the project is active today; most
+            # projects have already ended, so check the end date first
+            if not start_date or project_end_day is None or project_end_day < today:
+                continue
+            project_start_day = self._parse_date(start_date)
+            if project_start_day is None or project_start_day > today:
+                continue
+            current_direct_costs += direct_costs
+            current_total_costs += project_total_costs
+            current_project_count += 1
         
         return {
             'total_direct_costs': total_direct_costs,
             'total_costs': total_costs,
+            'current_direct_costs': current_direct_costs,
+            'current_total_costs': current_total_costs,
+            'current_projects': current_project_count,
+            'latest_end_date': latest_end_date,
             'project_count': len(processed_projects),
             'projects': processed_projects
         }
@@ -136,298 +865,186 @@ class NIHReporterSearcher:
         """
         Create a summary CSV file with key metrics for each person.
         
+        The CSV is assembled in memory and written to disk in a single call.
+        
         Args:
             results: Dictionary containing search results
             output_file: Path to output CSV file
         """
-        with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['Name', 'Total_Direct_Costs', 'Total_Costs', 'Most_Recent_Year', 'Total_Projects', 
-                         'Current_Direct_Costs', 'Current_Total_Costs', 'Current_Projects']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            writer.writeheader()
-            
-            # Sort results by last name for CSV output
-            sorted_results = self._sort_results_by_last_name(results)
-            
-            for name, data in sorted_results.items():
-                # Format name as "Last Name, First Name" for CSV
-                formatted_name = self._format_name_last_first(name)
-                
-                # Get totals directly from the data structure
-                total_direct = data.get('total_direct_costs', 0.0)
-                total_costs = data.get('total_costs', 0.0)
-                total_projects = data.get('total_projects', 0)
-                projects = data.get('projects', [])
-                
-                # Calculate current funding (projects active today)
-                current_direct = 0.0
-                current_total = 0.0
-                current_project_count = 0
-                today = datetime.now().date()
-                
-                for project in projects:
-                    start_date = project.get('start_date', '')
-                    end_date = project.get('end_date', '')
-                    
-                    if start_date and end_date:
-                        try:
-                            # Parse start and end dates
-                            project_start = datetime.strptime(start_date, '%Y-%m-%dT%H:%M:%S').date()
-                        except ValueError:
-                            try:
-                                project_start = datetime.strptime(start_date, '%Y-%m-%d').date()
-                            except ValueError:
-                                continue
-                        
-                        try:
-                            project_end = datetime.strptime(end_date, '%Y-%m-%dT%H:%M:%S').date()
-                        except ValueError:
-                            try:
-                                project_end = datetime.strptime(end_date, '%Y-%m-%d').date()
-                            except ValueError:
-                                continue
-                        
-                        # Check if project is currently active
-                        if project_start <= today <= project_end:
-                            current_direct += project.get('direct_costs', 0.0)
-                            current_total += project.get('total_costs', 0.0)
-                            current_project_count += 1
-                
-                # Find most recent year based on project end dates
-                most_recent_year = None
-                if projects:
-                    # Look through all projects to find the most recent end date
-                    latest_end_date = None
-                    for project in projects:
-                        end_date = project.get('end_date', '')
-                        if end_date:
-                            try:
-                                # Parse the end date and compare
-                                project_end_date = datetime.strptime(end_date, '%Y-%m-%dT%H:%M:%S')
-                                if latest_end_date is None or project_end_date > latest_end_date:
-                                    latest_end_date = project_end_date
-                            except ValueError:
-                                # Try alternative date format
-                                try:
-                                    project_end_date = datetime.strptime(end_date, '%Y-%m-%d')
-                                    if latest_end_date is None or project_end_date > latest_end_date:
-                                        latest_end_date = project_end_date
-                                except ValueError:
-                                    continue
-                    
-                    if latest_end_date:
-                        most_recent_year = latest_end_date.year
-                
-                writer.writerow({
-                    'Name': formatted_name,
-                    'Total_Direct_Costs': f"{total_direct:,.2f}",
-                    'Total_Costs': f"{total_costs:,.2f}",
-                    'Most_Recent_Year': most_recent_year or 'N/A',
-                    'Total_Projects': total_projects,
-                    'Current_Direct_Costs': f"{current_direct:,.2f}",
-                    'Current_Total_Costs': f"{current_total:,.2f}",
-                    'Current_Projects': current_project_count
-                })
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        
+        writer.writerow(SUMMARY_HEADERS)
+        
+        # Currency is written as plain numbers (no thousands separators) so
+        # the columns stay numeric for spreadsheets and scripts
+        writer.writerows(
+            [
+                row.name,
+                format(row.total_direct_costs, '.2f'),
+                format(row.total_costs, '.2f'),
+                row.most_recent_year or 'N/A',
+                row.total_projects,
+                format(row.current_direct_costs, '.2f'),
+                format(row.current_total_costs, '.2f'),
+                row.current_projects
+            ]
+            for row in self._iter_summary_rows(results)
+        )
+        
+        with open(output_file, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as csvfile:
+            csvfile.write(buffer.getvalue())
         
         print(f"Summary saved to: {output_file}")
     
+    def _iter_summary_rows(self, results: Dict[str, Any]) -> Iterator[SummaryRow]:
+        """
+        Build the summary row for each person, sorted by last name.
+        
+        Shared by the CSV and Excel writers so each formats the same values.
+        
+        Args:
+            results: Dictionary with results for each person
+            
+        Yields:
+            SummaryRow for each person
+        """
+        for name, data in self._sorted_items_by_last_name(results):
+            # Most recent year based on project end dates
+            latest_end_date = data.get('latest_end_date')
+            
+            yield SummaryRow(
+                name=_format_name_last_first(name),  # "Last Name, First Name"
+                total_direct_costs=data.get('total_direct_costs', 0.0),
+                total_costs=data.get('total_costs', 0.0),
+                most_recent_year=int(latest_end_date[:4]) if latest_end_date else None,
+                total_projects=data.get('total_projects', 0),
+                # Current funding (projects active today) is computed during processing
+                current_direct_costs=data.get('current_direct_costs', 0.0),
+                current_total_costs=data.get('current_total_costs', 0.0),
+                current_projects=data.get('current_projects', 0)
+            )
+    
     def create_summary_excel(self, results: Dict[str, Any], output_file: str) -> None:
         """
         Create an Excel summary file with funding data.
         
+        The workbook is written in openpyxl's write-only mode, which streams
+        rows to disk instead of keeping every cell in memory.
+        
         Args:
             results: Dictionary with results for each person
             output_file: Path to output Excel file
         """
-        # Create a new workbook and select the active worksheet
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "NIH Funding Summary"
+        # Create a new write-only workbook and worksheet
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("NIH Funding Summary")
         
-        # Define headers
-        headers = ['Name', 'Total_Direct_Costs', 'Total_Costs', 'Most_Recent_Year', 
-                  'Total_Projects', 'Current_Direct_Costs', 'Current_Total_Costs', 'Current_Projects']
+        # Build data rows, tracking the widest value in each column as we go
+        rows = []
+        max_lengths = [len(header) for header in SUMMARY_HEADERS]
+        for row in self._iter_summary_rows(results):
+            values = [row.name, row.total_direct_costs, row.total_costs, row.most_recent_year or 'N/A',
+                      row.total_projects, row.current_direct_costs, row.current_total_costs, row.current_projects]
+            for col, value in enumerate(values):
+                max_lengths[col] = max(max_lengths[col], len(str(value)))
+            rows.append(values)
         
-        # Style for headers
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        header_alignment = Alignment(horizontal="center", vertical="center")
+        # Size columns to their contents; write-only sheets need this before any rows
+        for col, max_length in enumerate(max_lengths, 1):
+            adjusted_width = min(max_length + 2, 50)  # Cap at 50 characters
+            ws.column_dimensions[get_column_letter(col)].width = adjusted_width
+        
+        # Shared style for currency cells
+        money_style = NamedStyle(name="money", number_format='#,##0.00')
+        wb.add_named_style(money_style)
         
         # Write headers
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_alignment
-        
-        # Sort results by last name for Excel output
-        sorted_results = self._sort_results_by_last_name(results)
-        
-        # Write data rows
-        row = 2
-        for name, data in sorted_results.items():
-            # Format name as "Last Name, First Name" for Excel
-            formatted_name = self._format_name_last_first(name)
-            
-            # Get totals directly from the data structure
-            total_direct = data.get('total_direct_costs', 0.0)
-            total_costs = data.get('total_costs', 0.0)
-            total_projects = data.get('total_projects', 0)
-            projects = data.get('projects', [])
-            
-            # Calculate current funding (projects active today)
-            current_direct = 0.0
-            current_total = 0.0
-            current_project_count = 0
-            today = datetime.now().date()
-            
-            for project in projects:
-                start_date = project.get('start_date', '')
-                end_date = project.get('end_date', '')
-                
-                if start_date and end_date:
-                    try:
-                        # Parse start and end dates
-                        project_start = datetime.strptime(start_date, '%Y-%m-%dT%H:%M:%S').date()
-                    except ValueError:
-                        try:
-                            project_start = datetime.strptime(start_date, '%Y-%m-%d').date()
-                        except ValueError:
-                            continue
-                    
-                    try:
-                        project_end = datetime.strptime(end_date, '%Y-%m-%dT%H:%M:%S').date()
-                    except ValueError:
-                        try:
-                            project_end = datetime.strptime(end_date, '%Y-%m-%d').date()
-                        except ValueError:
-                            continue
-                    
-                    # Check if project is currently active
-                    if project_start <= today <= project_end:
-                        current_direct += project.get('direct_costs', 0.0)
-                        current_total += project.get('total_costs', 0.0)
-                        current_project_count += 1
-            
-            # Find most recent year based on project end dates
-            most_recent_year = None
-            if projects:
-                # Look through all projects to find the most recent end date
-                latest_end_date = None
-                for project in projects:
-                    end_date = project.get('end_date', '')
-                    if end_date:
-                        try:
-                            # Parse the end date and compare
-                            project_end_date = datetime.strptime(end_date, '%Y-%m-%dT%H:%M:%S')
-                            if latest_end_date is None or project_end_date > latest_end_date:
-                                latest_end_date = project_end_date
-                        except ValueError:
-                            # Try alternative date format
-                            try:
-                                project_end_date = datetime.strptime(end_date, '%Y-%m-%d')
-                                if latest_end_date is None or project_end_date > latest_end_date:
-                                    latest_end_date = project_end_date
-                            except ValueError:
-                                continue
-                
-                if latest_end_date:
-                    most_recent_year = latest_end_date.year
-            
-            # Write row data
-            ws.cell(row=row, column=1, value=formatted_name)
-            ws.cell(row=row, column=2, value=total_direct)
-            ws.cell(row=row, column=3, value=total_costs)
-            ws.cell(row=row, column=4, value=most_recent_year or 'N/A')
-            ws.cell(row=row, column=5, value=total_projects)
-            ws.cell(row=row, column=6, value=current_direct)
-            ws.cell(row=row, column=7, value=current_total)
-            ws.cell(row=row, column=8, value=current_project_count)
-            
-            row += 1
-        
-        # Auto-adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)  # Cap at 50 characters
-            ws.column_dimensions[column_letter].width = adjusted_width
+        header_cells = []
+        for header in SUMMARY_HEADERS:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.font = HEADER_FONT
+            cell.fill = HEADER_FILL
+            cell.alignment = HEADER_ALIGNMENT
+            header_cells.append(cell)
+        ws.append(header_cells)
         
-        # Format number columns
-        for row in range(2, row):
-            # Format currency columns (2, 3, 6, 7)
-            for col in [2, 3, 6, 7]:
-                cell = ws.cell(row=row, column=col)
-                if cell.value and cell.value != 0:
-                    cell.number_format = '#,##0.00'
+        # Write data rows, formatting non-zero currency columns (2, 3, 6, 7)
+        for values in rows:
+            for col in (1, 2, 5, 6):
+                if values[col]:
+                    cell = WriteOnlyCell(ws, value=values[col])
+                    cell.style = money_style.name
+                    values[col] = cell
+            ws.append(values)
         
         # Save the workbook
         wb.save(output_file)
         print(f"Excel summary saved to: {output_file}")
     
-    def _sort_results_by_last_name(self, results: Dict[str, Any]) -> Dict[str, Any]:
+    def create_projects_parquet(self, results: Dict[str, Any], output_file: str) -> None:
         """
-        Sort results alphabetically by last name.
+        Write every person's projects to a Parquet file, one row per project.
+        
+        Requires pyarrow. Repeated strings such as names are dictionary-encoded
+        and the file is zstd-compressed, so it is much smaller than the JSON
+        results and loads straight into columnar tools.
         
         Args:
             results: Dictionary with results for each person
-            
-        Returns:
-            Dictionary sorted by last name
+            output_file: Path to output Parquet file
         """
-        def get_last_name(name: str) -> str:
-            """Extract last name from full name."""
-            # Split by space and take the last part as last name
-            parts = name.strip().split()
-            if not parts:
-                return ""
-            return parts[-1]
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        names = []
+        projects = []
+        for name, data in results.items():
+            person_projects = data.get('projects', [])
+            names.extend([name] * len(person_projects))
+            projects.extend(person_projects)
+        
+        columns = {'name': names}
+        for field in PARQUET_FIELDS:
+            columns[field] = [getattr(project, field) for project in projects]
         
-        # Sort the results by last name
-        sorted_items = sorted(results.items(), key=lambda x: get_last_name(x[0]))
-        return dict(sorted_items)
+        pq.write_table(pa.table(columns), output_file, compression='zstd')
     
-    def _format_name_last_first(self, name: str) -> str:
+    def _sorted_items_by_last_name(self, results: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
         """
-        Format name as "Last Name, First Name".
+        Sort results alphabetically by last name.
         
         Args:
-            name: Full name in "First Name Last Name" format
+            results: Dictionary with results for each person
             
         Returns:
-            Name formatted as "Last Name, First Name"
+            List of (name, data) pairs sorted by last name
         """
-        parts = name.strip().split()
-        if len(parts) < 2:
-            return name  # Return as-is if can't split properly
-        
-        # Last name is the last part, everything else is first name
-        last_name = parts[-1]
-        first_name = ' '.join(parts[:-1])
-        
-        return f"{last_name}, {first_name}"
+        return sorted(results.items(), key=lambda item: _last_name_key(item[0]))
     
-    def search_names_from_yaml(self, yaml_file: str, extra_text: str = "") -> Dict[str, Any]:
+    def search_names_from_yaml(self, yaml_file: str, extra_text: str = "", batch_size: int = 25,
+                               on_result: Callable[[str, Dict[str, Any]], None] = None) -> Dict[str, Any]:
         """
         Search for funding information for all names in a YAML file.
         
         Args:
-            yaml_file: Path to YAML file containing names
+            yaml_file: Path to YAML (or .json) file containing names
             extra_text: Optional organization name to filter by (e.g., "University of Minnesota")
+            batch_size: Number of names to combine into each API search
+            on_result: Optional callback invoked with each name and its results
+                as soon as they are processed
             
         Returns:
             Dictionary with results for each person
         """
         try:
-            with open(yaml_file, 'r') as f:
-                data = yaml.safe_load(f)
+            # JSON name lists are accepted too and skip YAML parsing entirely
+            if yaml_file.lower().endswith('.json'):
+                with open(yaml_file, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(yaml_file, 'r') as f:
+                    data = yaml.load(f, Loader=SafeLoader)
             
             names = data.get('names', [])
             if not names:
@@ -435,28 +1052,69 @@ class NIHReporterSearcher:
                 return {}
             
             results = {}
+            organization_filter = extra_text or None
+            location = f" at {extra_text}" if extra_text else ""
             
-            for name in names:
-                # Clean up the name (remove periods from middle initials for better API matching)
-                clean_name = name.replace('.', '').replace('  ', ' ')
-                print(f"Searching for: {clean_name}" + (f" at {extra_text}" if extra_text else ""))
-                projects = self.search_person(clean_name, extra_text)
-                processed_data = self.process_funding_data(projects)
-                
-                results[name] = {
-                    'total_projects': processed_data['project_count'],
-                    'total_direct_costs': processed_data['total_direct_costs'],
-                    'total_costs': processed_data['total_costs'],
-                    'projects': processed_data['projects'],
-                    'search_timestamp': datetime.now().isoformat(),
-                    'search_name_used': clean_name,
-                    'organization_filter': extra_text if extra_text else None
-                }
-                
-                print(f"Found {len(projects)} projects for {name}" + (f" at {extra_text}" if extra_text else ""))
+            # Clean up the names (remove periods from middle initials and extra
+            # whitespace for better API matching)
+            clean_names = [' '.join(name.translate(NAME_CLEAN_TRANSLATION).split()) for name in names]
+            names_by_clean_name = defaultdict(list)
+            for name, clean_name in zip(names, clean_names):
+                names_by_clean_name[clean_name].append(name)
+                print(f"Searching for: {clean_name}{location}")
+            
+            def process_results(search_results: Dict[str, Any]) -> None:
+                """Process finished searches and record the results for each person."""
+                for clean_name, projects in search_results.items():
+                    if isinstance(projects, Exception):
+                        print(f"Error searching for {clean_name}: {projects}")
+                        projects = []
+                    
+                    processed_data = self.process_funding_data(projects)
+                    
+                    for name in names_by_clean_name[clean_name]:
+                        results[name] = {
+                            'total_projects': processed_data['project_count'],
+                            'total_direct_costs': processed_data['total_direct_costs'],
+                            'total_costs': processed_data['total_costs'],
+                            'current_direct_costs': processed_data['current_direct_costs'],
+                            'current_total_costs': processed_data['current_total_costs'],
+                            'current_projects': processed_data['current_projects'],
+                            'latest_end_date': processed_data['latest_end_date'],
+                            'projects': processed_data['projects'],
+                            'search_timestamp': datetime.now().isoformat(),
+                            'search_name_used': clean_name,
+                            'organization_filter': organization_filter
+                        }
+                        if on_result:
+                            on_result(name, results[name])
+                        
+                        print(f"Found {len(projects)} projects for {name}{location}")
+            
+            # Names that clean to the same search are only looked up once
+            unique_clean_names = list(names_by_clean_name)
+            
+            # Reuse cached results and only search for the remaining names
+            # Each name is looked up once per run, so bulk results are kept
+            # on disk only rather than alongside the processed records
+            cached = self._load_cached(unique_clean_names, extra_text, keep_in_memory=False)
+            process_results(cached)
+            pending = [clean_name for clean_name in unique_clean_names if clean_name not in cached]
+            
+            def process_fetched(search_results: Dict[str, Any]) -> None:
+                """Process a finished batch and cache it, so its raw projects can be released."""
+                process_results(search_results)
+                self._store_cached({clean_name: projects for clean_name, projects in search_results.items()
+                                    if not isinstance(projects, Exception)}, extra_text,
+                                   keep_in_memory=False)
+            
+            if pending:
+                # Issue all searches concurrently; the workload is dominated by network latency
+                asyncio.run(self._search_names_async(pending, extra_text, batch_size,
+                                                     on_batch=process_fetched))
             
             # Sort results alphabetically by last name
-            return self._sort_results_by_last_name(results)
+            return dict(self._sorted_items_by_last_name(results))
             
         except FileNotFoundError:
             print(f"Error: YAML file '{yaml_file}' not found")
@@ -464,44 +1122,100 @@ class NIHReporterSearcher:
         except yaml.YAMLError as e:
             print(f"Error parsing YAML file: {e}")
             return {}
+        except orjson.JSONDecodeError as e:
+            print(f"Error parsing JSON file: {e}")
+            return {}
 
 
 def main():
     """Main function to run the NIH Reporter search."""
     parser = argparse.ArgumentParser(description='Search NIH Reporter API for funding information')
-    parser.add_argument('yaml_file', help='Path to YAML file containing names to search')
+    parser.add_argument('yaml_file', help='Path to YAML (or .json) file containing names to search')
     parser.add_argument('-o', '--output', help='Output JSON file (default: based on YAML filename)')
     parser.add_argument('--extra', help='Organization name to filter by (e.g., "University of Minnesota")')
+    parser.add_argument('--batch-size', type=int, default=25,
+                        help='Number of names to combine into each API search (default: 25)')
+    parser.add_argument('--concurrency', type=int, default=8,
+                        help='Maximum number of API requests in flight at once (default: 8)')
+    parser.add_argument('--cache-dir', help='Directory to cache API results in between runs')
+    parser.add_argument('--cache-ttl', type=float, default=24,
+                        help='Hours before cached results in --cache-dir expire (default: 24)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Search every name again instead of using cached results (the cache is still updated)')
+    parser.add_argument('--pretty', action='store_true',
+                        help='Indent the JSON results file for reading (default: compact)')
+    parser.add_argument('--verbose-json', action='store_true',
+                        help='Also include the raw budget and project dates for each project in the results')
+    parser.add_argument('--format', choices=['json', 'ndjson', 'parquet'], default='json',
+                        help='Results file format: one JSON document, one JSON line per person '
+                             'written as each search finishes, or one Parquet row per project '
+                             '(requires pyarrow) (default: json)')
     
     args = parser.parse_args()
+    if args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.format == 'parquet' and importlib.util.find_spec('pyarrow') is None:
+        parser.error("--format parquet requires pyarrow (pip install pyarrow)")
     
     # Generate output filename based on YAML file basename
     if args.output:
         output_file = args.output
     else:
         yaml_basename = os.path.splitext(os.path.basename(args.yaml_file))[0]
-        output_file = f"{yaml_basename}_results.json"
+        output_file = f"{yaml_basename}_results.{args.format}"
+    output_basename = os.path.splitext(output_file)[0]
     
     # Create searcher instance
-    searcher = NIHReporterSearcher()
+    searcher = NIHReporterSearcher(max_concurrency=args.concurrency, cache_dir=args.cache_dir,
+                                   cache_ttl=0 if args.no_cache else args.cache_ttl * 60 * 60,
+                                   include_raw_dates=args.verbose_json)
     
-    # Search for names
+    # Search for names, closing the connection pool once done
     extra_text = args.extra or ""
-    results = searcher.search_names_from_yaml(args.yaml_file, extra_text)
+    with searcher:
+        if args.format == 'ndjson':
+            # Write each person's results as soon as they are processed, into
+            # a temporary file that only replaces output_file once the search
+            # has succeeded, so a failed run never clobbers earlier results
+            partial_file = f"{output_file}.partial"
+            try:
+                with open(partial_file, 'wb') as f:
+                    def write_result(name: str, entry: Dict[str, Any]) -> None:
+                        f.write(orjson.dumps({name: entry}, option=orjson.OPT_APPEND_NEWLINE))
+                        f.flush()
+                        # The summaries only need the totals, so release the
+                        # project records once they are on disk
+                        entry.pop('projects', None)
+                    
+                    results = searcher.search_names_from_yaml(args.yaml_file, extra_text, args.batch_size,
+                                                              on_result=write_result)
+                if results:
+                    os.replace(partial_file, output_file)
+            finally:
+                if os.path.exists(partial_file):
+                    os.remove(partial_file)
+        else:
+            results = searcher.search_names_from_yaml(args.yaml_file, extra_text, args.batch_size)
     
     if results:
-        # Save results to JSON file
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        if args.format == 'json':
+            # Save results to JSON file, compact unless asked to pretty-print
+            option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if args.pretty else 0)
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(results, option=option))
+        elif args.format == 'parquet':
+            searcher.create_projects_parquet(results, output_file)
         
         print(f"\nResults saved to: {output_file}")
         
         # Create summary CSV
-        summary_file = output_file.replace('.json', '_summary.csv')
+        summary_file = f"{output_basename}_summary.csv"
         searcher.create_summary_csv(results, summary_file)
         
         # Create summary Excel
-        excel_file = output_file.replace('.json', '_summary.xlsx')
+        excel_file = f"{output_basename}_summary.xlsx"
         searcher.create_summary_excel(results, excel_file)
         
         # Print summary
@@ -0,0 +1,531 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the NIH Reporter Search Tool
+
+These tests never contact the NIH RePORTER API; run them with pytest.
+"""
+
+import asyncio
+import csv
+
+import aiohttp
+import orjson
+import pytest
+
+import nih_reporter_search
+from nih_reporter_search import NIHReporterSearcher
+
+
+def make_project(project_num, *investigators):
+    """Build an API project record with the given (first, last) PI names."""
+    return {
+        'project_num': project_num,
+        'principal_investigators': [
+            {'first_name': first_name, 'last_name': last_name}
+            for first_name, last_name in investigators
+        ]
+    }
+
+
+def project_nums(grouped):
+    """Reduce grouped projects to their project numbers for comparison."""
+    return {name: [project['project_num'] for project in projects] for name, projects in grouped.items()}
+
+
+# Summary CSV written by the original DictWriter implementation for one
+# non-ASCII name, kept as bytes to compare the new writer against
+BASELINE_NON_ASCII_CSV = (
+    b'Name,Total_Direct_Costs,Total_Costs,Most_Recent_Year,Total_Projects,'
+    b'Current_Direct_Costs,Current_Total_Costs,Current_Projects\r\n'
+    b'"N\xc3\xba\xc3\xb1ez, Jos\xc3\xa9","1,234.50","2,000.00",2003,1,0.00,0.00,0\r\n'
+)
+
+
+class FakeResponse:
+    """Stand-in for a requests response carrying one page of results."""
+
+    def __init__(self, projects):
+        self.content = orjson.dumps({'results': projects, 'meta': {'total': len(projects)}})
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """Stand-in for requests.Session that answers every search with the same projects."""
+
+    def __init__(self, projects):
+        self.projects = projects
+        self.calls = 0
+
+    def post(self, url, data=None, timeout=None):
+        self.calls += 1
+        return FakeResponse(self.projects)
+
+    def close(self):
+        pass
+
+
+class FakeAsyncResponse:
+    """Stand-in for an aiohttp response, failing with the given HTTP status."""
+
+    def __init__(self, status=200, body=None, headers=None):
+        self.status = status
+        self.body = body if body is not None else {'results': [], 'meta': {'total': 0}}
+        self.headers = headers or {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(None, (), status=self.status, headers=self.headers)
+
+    async def json(self, loads=None):
+        return self.body
+
+
+class FakeAsyncSession:
+    """Stand-in for aiohttp.ClientSession that replays a list of responses in order."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def post(self, url, data=None, timeout=None):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+def make_searcher(projects, **kwargs):
+    """Build a searcher whose synchronous session is a FakeSession."""
+    searcher = NIHReporterSearcher(**kwargs)
+    searcher.session = FakeSession(projects)
+    return searcher
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff delays instead of sleeping, with no random jitter."""
+    delays = []
+
+    async def fake_sleep(seconds):
+        delays.append(seconds)
+
+    monkeypatch.setattr(nih_reporter_search.asyncio, 'sleep', fake_sleep)
+    monkeypatch.setattr(nih_reporter_search.random, 'random', lambda: 0.0)
+    return delays
+
+
+def post_async(searcher, session):
+    """Run one _post_async call against a fake session."""
+    async def run():
+        return await searcher._post_async(session, asyncio.Semaphore(1), {'criteria': {}})
+    return asyncio.run(run())
+
+
+def test_group_projects_middle_initial_does_not_match_other_first_names():
+    """A middle initial must not claim projects of a PI with that first initial."""
+    searcher = NIHReporterSearcher()
+    projects = [
+        make_project('P1', ('Alice', 'Fisher')),
+        make_project('P2', ('Melissa', 'Fisher')),
+    ]
+
+    grouped = searcher._group_projects_by_name(['Alice Fisher', 'Melissa A Fisher'], projects)
+
+    assert project_nums(grouped) == {'Alice Fisher': ['P1'], 'Melissa A Fisher': ['P2']}
+
+
+def test_group_projects_leading_initial_falls_back_to_second_name():
+    """A name led by a bare initial may match the PI's second given name."""
+    searcher = NIHReporterSearcher()
+    projects = [
+        make_project('P1', ('Sophia', 'Albott')),
+        make_project('P2', ('Craig', 'Albott')),
+        make_project('P3', ('Mark', 'Albott')),
+    ]
+
+    grouped = searcher._group_projects_by_name(['C. Sophia Albott', 'Mark Albott'], projects)
+
+    assert project_nums(grouped) == {'C. Sophia Albott': ['P1', 'P2'], 'Mark Albott': ['P3']}
+
+
+def test_partially_matched_name_is_searched_individually():
+    """A name with unassigned projects under its last name is searched again."""
+    searcher = NIHReporterSearcher()
+    projects = [
+        make_project('P1', ('William', 'Smith')),
+        make_project('P2', ('Jane', 'Doe')),
+        make_project('P3', ('Bill', 'Smith')),
+    ]
+    grouped = searcher._group_projects_by_name(['William Smith', 'Jane Doe'], projects)
+
+    assert project_nums(grouped) == {'William Smith': ['P1'], 'Jane Doe': ['P2']}
+    assert searcher._names_to_search_individually(projects, grouped) == ['William Smith']
+
+
+def test_group_projects_initials_only():
+    """A name of initials matches PIs by the initial, or the second initial."""
+    searcher = NIHReporterSearcher()
+    projects = [
+        make_project('P1', ('John', 'Smith')),
+        make_project('P2', ('Robert', 'Smith')),
+        make_project('P3', ('Mary', 'Smith')),
+    ]
+
+    grouped = searcher._group_projects_by_name(['J. R. Smith', 'Jane Doe'], projects)
+
+    assert project_nums(grouped) == {'J. R. Smith': ['P1', 'P2'], 'Jane Doe': []}
+
+
+def test_group_projects_shared_last_name_with_several_pis():
+    """A project with several matching PIs is assigned to each of them."""
+    searcher = NIHReporterSearcher()
+    projects = [
+        make_project('P1', ('Ann', 'Lee'), ('Brian', 'Lee')),
+        make_project('P2', ('Brian', 'Lee')),
+        make_project('P3', ('Ann-Marie', 'Lee-Park')),
+    ]
+
+    grouped = searcher._group_projects_by_name(['Ann Lee', 'Brian Lee'], projects)
+
+    assert project_nums(grouped) == {'Ann Lee': ['P1', 'P3'], 'Brian Lee': ['P1', 'P2']}
+
+
+def test_search_people_async_groups_batched_results():
+    """The async batch path assigns results with the same first-name rule."""
+    searcher = NIHReporterSearcher()
+    projects = [
+        make_project('P1', ('Alice', 'Fisher')),
+        make_project('P2', ('Melissa', 'Fisher')),
+    ]
+    session = FakeAsyncSession([FakeAsyncResponse(body={'results': projects, 'meta': {'total': 2}})])
+
+    async def run():
+        return await searcher._search_people_async(session, asyncio.Semaphore(1),
+                                                   ['Alice Fisher', 'Melissa A Fisher'])
+
+    assert project_nums(asyncio.run(run())) == {'Alice Fisher': ['P1'], 'Melissa A Fisher': ['P2']}
+    assert session.calls == 1
+
+
+def test_cache_miss_then_memory_hit():
+    """A repeated search is answered from memory without another request."""
+    searcher = make_searcher([make_project('P1', ('Jane', 'Doe'))])
+
+    first = searcher.search_person('Jane Doe')
+    second = searcher.search_person('Jane Doe')
+
+    assert [project['project_num'] for project in second] == ['P1']
+    assert second == first
+    assert searcher.session.calls == 1
+
+
+def test_cache_is_scoped_by_organization():
+    """The same name with another organization filter is a cache miss."""
+    searcher = make_searcher([make_project('P1', ('Jane', 'Doe'))])
+
+    searcher.search_person('Jane Doe')
+    searcher.search_person('Jane Doe', 'University of Minnesota')
+
+    assert searcher.session.calls == 2
+
+
+def test_disk_cache_hit_across_searchers(tmp_path):
+    """Results cached on disk are reused by a later searcher."""
+    make_searcher([make_project('P1', ('Jane', 'Doe'))], cache_dir=str(tmp_path)).search_person('Jane Doe')
+
+    searcher = make_searcher([], cache_dir=str(tmp_path))
+    projects = searcher.search_person('Jane Doe')
+
+    assert [project['project_num'] for project in projects] == ['P1']
+    assert searcher.session.calls == 0
+
+
+def test_disk_cache_entry_expires_after_ttl(tmp_path, monkeypatch):
+    """An entry older than cache_ttl is searched again and replaced."""
+    make_searcher([make_project('P1', ('Jane', 'Doe'))], cache_dir=str(tmp_path),
+                  cache_ttl=60).search_person('Jane Doe')
+
+    now = nih_reporter_search.time.time()
+    monkeypatch.setattr(nih_reporter_search.time, 'time', lambda: now + 61)
+    searcher = make_searcher([make_project('P2', ('Jane', 'Doe'))], cache_dir=str(tmp_path), cache_ttl=60)
+    projects = searcher.search_person('Jane Doe')
+
+    assert [project['project_num'] for project in projects] == ['P2']
+    assert searcher.session.calls == 1
+
+
+def test_post_async_retries_with_exponential_backoff(sleeps):
+    """Transient server errors are retried, doubling the wait each time."""
+    searcher = NIHReporterSearcher(max_retries=5)
+    session = FakeAsyncSession([FakeAsyncResponse(503), FakeAsyncResponse(502),
+                                FakeAsyncResponse(500), FakeAsyncResponse()])
+
+    data = post_async(searcher, session)
+
+    assert data == {'results': [], 'meta': {'total': 0}}
+    assert session.calls == 4
+    assert sleeps == [1, 2, 4]
+
+
+def test_post_async_honors_retry_after(sleeps):
+    """A Retry-After header sets the wait, capped at MAX_BACKOFF."""
+    searcher = NIHReporterSearcher(max_retries=5)
+    session = FakeAsyncSession([FakeAsyncResponse(429, headers={'Retry-After': '7'}),
+                                FakeAsyncResponse(429, headers={'Retry-After': '600'}),
+                                FakeAsyncResponse()])
+
+    post_async(searcher, session)
+
+    assert sleeps == [7.0, float(nih_reporter_search.MAX_BACKOFF)]
+
+
+def test_post_async_gives_up_after_max_retries(sleeps):
+    """The error from the last attempt is raised once the retries run out."""
+    searcher = NIHReporterSearcher(max_retries=3)
+    session = FakeAsyncSession([FakeAsyncResponse(503) for _ in range(3)])
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        post_async(searcher, session)
+
+    assert session.calls == 3
+    assert sleeps == [1, 2]
+
+
+def test_post_async_does_not_retry_client_errors(sleeps):
+    """Errors other than rate limiting and server errors are raised at once."""
+    searcher = NIHReporterSearcher(max_retries=5)
+    session = FakeAsyncSession([FakeAsyncResponse(400)])
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        post_async(searcher, session)
+
+    assert session.calls == 1
+    assert sleeps == []
+
+
+def test_post_async_makes_one_attempt_without_retries(sleeps):
+    """max_retries below 1 still makes a single request."""
+    searcher = NIHReporterSearcher(max_retries=0)
+    session = FakeAsyncSession([FakeAsyncResponse()])
+
+    assert post_async(searcher, session) == {'results': [], 'meta': {'total': 0}}
+    assert session.calls == 1
+
+
+def test_summary_csv_matches_baseline_for_non_ascii_names(tmp_path):
+    """Non-ASCII names are written as the same UTF-8 cells as before.
+    
+    Currency is now written without thousands separators, so those cells are
+    compared as numbers; everything else must match the baseline exactly.
+    """
+    searcher = NIHReporterSearcher()
+    results = {
+        'José Núñez': {
+            'total_projects': 1,
+            'total_direct_costs': 1234.5,
+            'total_costs': 2000.0,
+            'current_direct_costs': 0.0,
+            'current_total_costs': 0.0,
+            'current_projects': 0,
+            'latest_end_date': '2003-06-30T00:00:00',
+            'projects': []
+        }
+    }
+    output_file = tmp_path / 'summary.csv'
+
+    searcher.create_summary_csv(results, str(output_file))
+
+    written = output_file.read_bytes()
+    assert written.splitlines()[0] == BASELINE_NON_ASCII_CSV.splitlines()[0]
+    assert written.splitlines()[1].startswith(b'"N\xc3\xba\xc3\xb1ez, Jos\xc3\xa9",')
+
+    new_rows = list(csv.reader(written.decode('utf-8').splitlines()))
+    baseline_rows = list(csv.reader(BASELINE_NON_ASCII_CSV.decode('utf-8').splitlines()))
+    money_columns = {1, 2, 5, 6}
+    for new_row, baseline_row in zip(new_rows[1:], baseline_rows[1:]):
+        for column, (new_cell, baseline_cell) in enumerate(zip(new_row, baseline_row)):
+            if column in money_columns:
+                assert float(new_cell) == float(baseline_cell.replace(',', ''))
+            else:
+                assert new_cell == baseline_cell
+    assert len(new_rows) == len(baseline_rows)
+
+
+def test_unparseable_end_date_is_not_the_latest(tmp_path):
+    """A stray end date like 'n/a' is ignored rather than breaking the summaries."""
+    searcher = NIHReporterSearcher()
+    processed = searcher.process_funding_data([
+        {'project_num': 'P1', 'budget_end': '2019-06-30T00:00:00'},
+        {'project_num': 'P2', 'budget_end': 'n/a'},
+    ])
+    assert processed['latest_end_date'] == '2019-06-30T00:00:00'
+
+    only_bad = searcher.process_funding_data([{'project_num': 'P1', 'budget_end': 'garbage'}])
+    assert only_bad['latest_end_date'] is None
+
+    results = {'Jane Doe': {'total_projects': 1, 'latest_end_date': only_bad['latest_end_date']}}
+    searcher.create_summary_csv(results, str(tmp_path / 'summary.csv'))
+    searcher.create_summary_excel(results, str(tmp_path / 'summary.xlsx'))
+    assert (tmp_path / 'summary.csv').read_text(encoding='utf-8').splitlines()[1].startswith('"Doe, Jane",0.00,0.00,N/A,')
+
+
+def test_memory_cache_respects_ttl():
+    """With cache_ttl=0 (as with --no-cache) every search goes to the API."""
+    searcher = make_searcher([make_project('P1', ('Jane', 'Doe'))], cache_ttl=0)
+
+    searcher.search_person('Jane Doe')
+    searcher.search_person('Jane Doe')
+
+    assert searcher.session.calls == 2
+
+
+def test_memory_cache_drops_least_recently_used(monkeypatch):
+    """The in-memory cache holds at most MEMORY_CACHE_SIZE searches."""
+    monkeypatch.setattr(nih_reporter_search, 'MEMORY_CACHE_SIZE', 2)
+    searcher = make_searcher([])
+
+    searcher.search_person('Ann Lee')
+    searcher.search_person('Bob Lee')
+    searcher.search_person('Ann Lee')
+    searcher.search_person('Cal Lee')
+    assert searcher.session.calls == 3
+
+    searcher.search_person('Ann Lee')
+    assert searcher.session.calls == 3
+    searcher.search_person('Bob Lee')
+    assert searcher.session.calls == 4
+
+
+def test_failed_individual_search_only_affects_its_name(sleeps):
+    """A re-search that fails is recorded for that name alone."""
+    searcher = NIHReporterSearcher(max_retries=1)
+    projects = [
+        make_project('P1', ('Alice', 'Roe')),
+        make_project('P2', ('J.', 'Doe')),
+    ]
+    session = FakeAsyncSession([FakeAsyncResponse(body={'results': projects, 'meta': {'total': 2}}),
+                                FakeAsyncResponse(503)])
+
+    async def run():
+        return await searcher._search_people_async(session, asyncio.Semaphore(1), ['Alice Roe', 'Jane Doe'])
+
+    grouped = asyncio.run(run())
+
+    assert [project['project_num'] for project in grouped['Alice Roe']] == ['P1']
+    assert isinstance(grouped['Jane Doe'], aiohttp.ClientResponseError)
+
+
+def test_search_people_batch_groups_and_caches(monkeypatch):
+    """The synchronous batch API searches once per batch and caches each name."""
+    projects = [
+        make_project('P1', ('Alice', 'Fisher')),
+        make_project('P2', ('Melissa', 'Fisher')),
+    ]
+    session = FakeAsyncSession([FakeAsyncResponse(body={'results': projects, 'meta': {'total': 2}})])
+    monkeypatch.setattr(nih_reporter_search.aiohttp, 'ClientSession', lambda **kwargs: session)
+    monkeypatch.setattr(nih_reporter_search.aiohttp, 'TCPConnector', lambda **kwargs: None)
+    searcher = NIHReporterSearcher()
+
+    first = searcher.search_people_batch(['Alice Fisher', 'Melissa A Fisher'])
+    second = searcher.search_people_batch(['Melissa A Fisher', 'Alice Fisher'])
+
+    assert project_nums(first) == {'Alice Fisher': ['P1'], 'Melissa A Fisher': ['P2']}
+    assert project_nums(second) == project_nums(first)
+    assert session.calls == 1
+
+
+def make_funding_project(project_num, budget_start=None, budget_end=None, project_start=None, project_end=None,
+                         direct=None, indirect=None, award=None):
+    """Build an API project record with the fields process_funding_data reads."""
+    return {
+        'project_num': project_num,
+        'project_title': f'Title {project_num}',
+        'budget_start': budget_start,
+        'budget_end': budget_end,
+        'project_start_date': project_start,
+        'project_end_date': project_end,
+        'direct_cost_amt': direct,
+        'indirect_cost_amt': indirect,
+        'award_amount': award,
+    }
+
+
+def test_process_funding_data_totals_and_current_funding():
+    """Totals cover every project; current totals only those active today."""
+    searcher = NIHReporterSearcher()
+    processed = searcher.process_funding_data([
+        # Ended long ago
+        make_funding_project('ENDED', '2001-01-01T00:00:00', '2001-12-31T00:00:00', direct=100.0, award=150.0),
+        # Active today; null budget dates fall back to the project dates
+        make_funding_project('ACTIVE', project_start='2000-01-01T00:00:00', project_end='2999-12-31T00:00:00',
+                             direct=200.0, indirect=50.0),
+        # Starts in the future
+        make_funding_project('FUTURE', '2998-01-01', '2998-12-31', direct=300.0, indirect=30.0, award=400.0),
+        # Null costs, and an end date that does not parse
+        make_funding_project('UNKNOWN', '2000-01-01T00:00:00', 'n/a'),
+    ])
+
+    assert processed['project_count'] == 4
+    assert processed['total_direct_costs'] == 600.0
+    # award_amount when present, otherwise direct + indirect
+    assert processed['total_costs'] == 150.0 + 250.0 + 400.0
+    assert processed['current_direct_costs'] == 200.0
+    assert processed['current_total_costs'] == 250.0
+    assert processed['current_projects'] == 1
+    assert processed['latest_end_date'] == '2999-12-31T00:00:00'
+
+    records = {record.project_id: record for record in processed['projects']}
+    assert (records['ACTIVE'].start_date, records['ACTIVE'].end_date) == \
+        ('2000-01-01T00:00:00', '2999-12-31T00:00:00')
+    assert records['ACTIVE'].total_costs == 250.0
+    assert records['ENDED'].total_costs == 150.0
+    assert (records['UNKNOWN'].direct_costs, records['UNKNOWN'].total_costs) == (0.0, 0.0)
+
+
+def test_summary_excel_values_formats_and_widths(tmp_path):
+    """The write-only Excel summary holds the row values, money formats and column widths."""
+    import openpyxl
+
+    searcher = NIHReporterSearcher()
+    results = {
+        'Jane Doe': {
+            'total_projects': 2,
+            'total_direct_costs': 1234567.5,
+            'total_costs': 2000000.0,
+            'current_direct_costs': 0.0,
+            'current_total_costs': 0.0,
+            'current_projects': 0,
+            'latest_end_date': '2021-06-30T00:00:00',
+        }
+    }
+    output_file = tmp_path / 'summary.xlsx'
+
+    searcher.create_summary_excel(results, str(output_file))
+
+    ws = openpyxl.load_workbook(output_file).active
+    rows = [[cell.value for cell in row] for row in ws.iter_rows()]
+    assert rows == [
+        list(nih_reporter_search.SUMMARY_HEADERS),
+        ['Doe, Jane', 1234567.5, 2000000.0, 2021, 2, 0, 0, 0],
+    ]
+
+    data_row = list(ws.iter_rows(min_row=2, max_row=2))[0]
+    assert [cell.number_format for cell in data_row[1:3]] == ['#,##0.00', '#,##0.00']
+    assert [cell.number_format for cell in data_row[5:7]] == ['General', 'General']
+
+    widths = [ws.column_dimensions[letter].width for letter in 'ABCDEFGH']
+    # Each column is as wide as its longest value plus padding
+    assert widths[0] == len('Doe, Jane') + 2
+    assert widths[1:] == [len(header) + 2 for header in nih_reporter_search.SUMMARY_HEADERS[1:]]